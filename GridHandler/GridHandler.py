@@ -1,23 +1,96 @@
 import os
+import json
+import time
 import logging
+import tempfile
+import threading
 import ROOT
-from multiprocessing import Pool, current_process
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+import multiprocessing
+from multiprocessing import current_process
+from itertools import chain, islice
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 try:
     import alienpy.alien as alien
 except ImportError:
     alien = None
 
-# Logging setup
-logging.basicConfig(
-    level=logging.DEBUG,  # log everything by default
-    format="%(asctime)s [%(levelname)s] [PID %(process)d] %(message)s",
-    datefmt="%H:%M:%S",
-)
+try:
+    from alienpy.wb_api import wb_close
+except ImportError:
+    wb_close = None
+
+try:
+    from XRootD import client as xrd_client
+except ImportError:
+    xrd_client = None
+
+# Logging setup, levels and format are left to the caller
 logger = logging.getLogger(__name__)
 
 # per work grid connection
 _worker_grid_connection = None  # process-local TGrid connection
+_worker_backend = None  # process-local copy of GridHandler.backend
+_worker_copy_buffer_size = None  # process-local copy of GridHandler.copy_buffer_size
+_worker_use_grid = True  # False when sources are read through an XCache
+
+
+def _connect_worker_grid():
+    global _worker_grid_connection
+
+    if _worker_grid_connection is None:
+        ROOT.gROOT.ProcessLine('TGrid::Connect("alien://")')
+        grid = ROOT.gGrid
+        if not grid or not grid.IsConnected():
+            logger.error(f"❌ [Worker {current_process().pid}] TGrid connection failed")
+            return None
+        _worker_grid_connection = grid
+    return _worker_grid_connection
+
+
+def _init_worker(backend, copy_buffer_size, use_grid):
+    global _worker_backend, _worker_copy_buffer_size, _worker_use_grid
+
+    # workers only get these settings instead of a pickled GridHandler per task
+    _worker_backend = backend
+    _worker_copy_buffer_size = copy_buffer_size
+    _worker_use_grid = use_grid
+
+    # connect while the pool starts up, so all workers do their handshake
+    # concurrently instead of each one stalling on its first file, root://
+    # sources from an XCache need no grid connection at all
+    if use_grid:
+        _connect_worker_grid()
+
+
+def _worker_download_file(args):
+    remote_file, local_file = args
+
+    if _worker_backend == "TGrid":
+        return _worker_download_tgrid(remote_file, local_file)
+    elif _worker_backend == "alienpy":
+        logger.warning(
+            f"⚠️ [Worker {current_process().pid}] alienpy backend does not use multiprocessing. Skipping."
+        )
+        return None
+    else:
+        logger.error(f"❌ Unknown backend: {_worker_backend}")
+        return None
+
+
+def _worker_download_tgrid(remote_file, local_file):
+    if _worker_use_grid and _connect_worker_grid() is None:
+        return None
+
+    logger.debug(f"⬇️ [Worker {current_process().pid}] {remote_file} → {local_file}")
+    # no progress bar and a large buffer keep the number of write calls low
+    if ROOT.TFile.Cp(remote_file, local_file, False, _worker_copy_buffer_size):
+        return local_file
+    else:
+        logger.error(f"❌ Download failed: {remote_file}")
+        return None
 
 
 class GridHandler:
@@ -26,42 +99,85 @@ class GridHandler:
         self.output_dir = config.get("output_dir", "grid")
         self.remote_files = config.get("remote_files", None)
         self.remote_files_glob = config.get("remote_files_glob", None)
+        self.file_sizes = {}  # remote path -> size in bytes, where known
         self.num_workers = config.get("num_workers", 16)
         self.keep_depth = config.get("keep_depth", 5)
+        self.num_streams = config.get("num_streams", 4)  # TGrid backend only
+        self.xcache_url = config.get("xcache_url", None)
+        self.copy_buffer_size = config.get("copy_buffer_size", 8 * 1024 * 1024)
+        self.batch_size = config.get("batch_size", 16)
+        self.max_inflight = config.get("max_inflight", 4)
+        self.cache_ttl = config.get("cache_ttl", 3600)
+        # start downloading while globs are still resolved, this gives up
+        # largest-first scheduling since the full file list is never known
+        self.stream_downloads = config.get("stream_downloads", False)
         self.alien_args = config.get(
             "alien_xrd_args", ["-timeout", "600", "-retry", "3"]
         )
         self.alien_args.append(["-T", f"{self.num_workers}"])
 
         os.makedirs(self.output_dir, exist_ok=True)
+        self._out_prefix = self.output_dir.rstrip("/") + "/"
+        self.glob_cache_path = os.path.join(self.output_dir, ".glob_cache.json")
         logger.debug(
             f"Initialized GridHandler with backend {self.backend}, output_dir {self.output_dir}"
         )
 
         self.alien_session = None
+        self._alien_idle = []  # connected sessions not in use by any thread
+        self._alien_lock = threading.Lock()
+
+    # AliEn sessions cannot be pickled, a copy reconnects lazily
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for key in ("alien_session", "_alien_idle", "_alien_lock"):
+            state.pop(key, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.alien_session = None
+        self._alien_idle = []
+        self._alien_lock = threading.Lock()
 
     # Helper functions
     def _unique_local_path(self, remote_path: str) -> str:
-        parts = remote_path.strip("/").split("/")
-        filename = parts[-1]
+        # for URLs only the path part maps to the local directory structure
+        if "://" in remote_path:
+            remote_path = urlsplit(remote_path).path
+        remote_path = remote_path.strip("/")
 
         # keep full directory structure relative to last 'keep_depth' dirs if set
         if self.keep_depth is None:
-            return os.path.join(self.output_dir, *parts)  # preserve full path
+            return self._out_prefix + remote_path  # preserve full path
         else:
-            sub_path = os.path.join(
-                *parts[-(self.keep_depth + 1) : -1]
-            )  # last N dirs before filename
-            return os.path.join(self.output_dir, sub_path, filename)
-
-    def _auto_unique_path(self, remote_path, filename):
-        seen = set()
-        for depth in range(1, 10):
-            local_name = "_".join(remote_path.strip("/").split("/")[-depth:])
-            if local_name not in seen:
-                seen.add(local_name)
-                return os.path.join(self.output_dir, local_name)
-        return os.path.join(self.output_dir, filename)
+            # last N dirs before filename plus the filename itself
+            tail = remote_path.rsplit("/", self.keep_depth + 1)
+            if len(tail) > self.keep_depth + 1:
+                tail = tail[1:]
+            return self._out_prefix + "/".join(tail)
+
+    @contextmanager
+    def _xrootd_env(self):
+        # XrdCl reads its tuning from the environment when it is first used,
+        # so it has to be set while the TGrid workers are started; values set
+        # by the user take precedence and ours are removed again afterwards,
+        # so a later GridHandler in the same process can use its own
+        values = {
+            "XRD_PARALLELEVTLOOP": "10",
+            "XRD_SUBSTREAMSPERCHANNEL": str(self.num_streams),
+        }
+        added = [k for k in values if k not in os.environ]
+        for k in added:
+            os.environ[k] = values[k]
+        logger.debug(
+            f"Using {os.environ['XRD_SUBSTREAMSPERCHANNEL']} XRootD substreams per channel"
+        )
+        try:
+            yield
+        finally:
+            for k in added:
+                os.environ.pop(k, None)
 
     # AliEn connection
     def _ensure_alien_connection(self):
@@ -73,157 +189,423 @@ class GridHandler:
             self.alien_session = alien.InitConnection()
             if not self.alien_session:
                 logger.error("❌ Failed to connect to AliEn.")
+            else:
+                with self._alien_lock:
+                    self._alien_idle.append(self.alien_session)
         return self.alien_session
 
-    # Download helpers
-    def _download_file(self, args):
-        remote_file, local_file = args
-        os.makedirs(os.path.dirname(local_file), exist_ok=True)
+    def close(self):
+        """Close all AliEn sessions held by this handler."""
+        with self._alien_lock:
+            sessions, self._alien_idle = self._alien_idle, []
+        for session in sessions:
+            self._close_alien_session(session, "GridHandler closed")
+        self.alien_session = None
 
-        if os.path.exists(local_file):
-            logger.info(
-                f"✅ [Worker {current_process().pid}] Skipping existing file: {local_file}"
+    def _close_alien_session(self, session, reason):
+        # wb_close is a synchronous wrapper around the websocket close
+        if wb_close is None:
+            logger.debug("alienpy provides no wb_close, leaving session open")
+            return
+        try:
+            wb_close(session, code=1000, reason=reason)
+        except Exception as e:
+            logger.debug(f"Closing AliEn session failed: {e}")
+
+    @contextmanager
+    def _pooled_alien_connection(self):
+        # alienpy sessions are not safe to share between threads, so each
+        # task borrows an idle session and only connects if none is left;
+        # sessions stay in the pool for later tasks and download() calls
+        with self._alien_lock:
+            session = self._alien_idle.pop() if self._alien_idle else None
+        if session is None:
+            logger.debug(
+                f"🔗 Connecting to AliEn from thread {threading.current_thread().name}"
             )
-            return local_file
+            session = alien.InitConnection()
+            if not session:
+                raise RuntimeError("Failed to connect to AliEn")
+        try:
+            yield session
+        except Exception:
+            # the session may be broken, do not hand it to later tasks
+            self._discard_alien_session(session)
+            raise
+        with self._alien_lock:
+            self._alien_idle.append(session)
+
+    def _discard_alien_session(self, session):
+        if session is self.alien_session:
+            self.alien_session = None
+        self._close_alien_session(session, "GridHandler discarded session")
 
-        if self.backend == "TGrid":
-            return self._download_tgrid(remote_file, local_file)
-        elif self.backend == "alienpy":
-            logger.warning(
-                f"⚠️ [Worker {current_process().pid}] alienpy backend does not use multiprocessing. Skipping."
-            )
-            return None
-        else:
-            logger.error(f"❌ Unknown backend: {self.backend}")
-            return None
+    # Download helpers
+    def _batches(self, copy_iter):
+        # split (remote, local) pairs into lists of sources and destinations
+        # while consuming them, so an unfinished glob resolution can feed them
+        copy_iter = iter(copy_iter)
+        while batch := list(islice(copy_iter, self.batch_size)):
+            yield [r for r, _ in batch], [l for _, l in batch]
+
+    def _download_alien(self, copy_iter):
+        if not self._ensure_alien_connection():
+            return 0
 
-    def _download_tgrid(self, remote_file, local_file):
-        global _worker_grid_connection
+        logger.info("⬇️ Starting AliEn download...")
 
-        if _worker_grid_connection is None:
-            ROOT.gROOT.ProcessLine('TGrid::Connect("alien://")')
-            _worker_grid_connection = ROOT.gGrid
-            if not _worker_grid_connection or not _worker_grid_connection.IsConnected():
-                logger.error(
-                    f"❌ [Worker {current_process().pid}] TGrid connection failed"
+        def _copy_batch(batch):
+            src, dst = batch
+            with self._pooled_alien_connection() as session:
+                result = alien.DO_XrootdCp(
+                    wb=session,
+                    xrd_copy_command=self.alien_args,
+                    api_src=src,
+                    api_dst=dst,
                 )
-                return None
-
-        grid = _worker_grid_connection
-
-        src = (
-            f"alien://{remote_file}"
-            if not remote_file.startswith("alien://")
-            else remote_file
-        )
-        dst = f"file:{local_file}" if not local_file.startswith("file:") else local_file
+            if result.exitcode == 0:
+                return len(src)
 
-        logger.info(f"⬇️ [Worker {current_process().pid}] {src} → {local_file}")
-        if ROOT.TFile.Cp(src, dst):
-            return local_file
-        else:
-            logger.error(f"❌ Download failed: {remote_file}")
-            return None
-
-    def _download_alien(self, remote_files, local_files):
-        session = self._ensure_alien_connection()
-        if not session:
+            # DO_XrootdCp only reports one exit code for the whole batch, so
+            # check which files actually arrived
+            n_done = sum(os.path.isfile(d.removeprefix("file:")) for d in dst)
+            logger.error(
+                f"❌ AliEn batch download failed for {len(dst) - n_done}/{len(dst)} files: "
+                f"{result.err or f'exit code {result.exitcode}'}"
+            )
+            return n_done
+
+        n_ok = 0
+        with ThreadPoolExecutor(max_workers=self.max_inflight) as executor:
+            futures = [
+                executor.submit(_copy_batch, b) for b in self._batches(copy_iter)
+            ]
+            for future in as_completed(futures):
+                try:
+                    n_ok += future.result()
+                except Exception as e:
+                    logger.error(f"❌ AliEn batch download failed: {e}")
+
+        logger.info(f"✅ AliEn download finished, {n_ok} files transferred.")
+        return n_ok
+
+    def _copy_xrootd_batch(self, remote_files, local_files):
+        # one CopyProcess per batch shares the setup cost across its jobs
+        process = xrd_client.CopyProcess()
+        # max_inflight batches share the num_workers transfer budget
+        process.parallel(max(1, self.num_workers // self.max_inflight))
+        for src, dst in zip(remote_files, local_files):
+            process.add_job(src, dst)
+
+        status = process.prepare()
+        if not status.ok:
+            logger.error(f"❌ XRootD batch preparation failed: {status.message}")
             return 0
+        status, results = process.run()
+        if not status.ok:
+            logger.error(f"❌ XRootD batch run failed: {status.message}")
+
+        # a job without a result or status did not complete
+        results = list(results or [])
+        results += [{}] * (len(remote_files) - len(results))
+        n_ok = 0
+        for src, result in zip(remote_files, results):
+            job_status = result.get("status")
+            if job_status is not None and job_status.ok:
+                n_ok += 1
+            else:
+                reason = job_status.message if job_status is not None else "no status"
+                logger.error(f"❌ Download failed: {src} ({reason})")
+        return n_ok
 
-        prefixed_remote = [
-            f"alien://{r}" if not r.startswith("alien://") else r for r in remote_files
-        ]
-        prefixed_local = [
-            f"file:{l}" if not l.startswith("file:") else l for l in local_files
-        ]
+    def _download_xrootd(self, copy_iter):
+        if not xrd_client:
+            logger.error("❌ XRootD python bindings not installed.")
+            return 0
 
-        logger.info(f"⬇️ Starting AliEn download of {len(remote_files)} files...")
+        logger.info("⬇️ Starting XRootD download...")
+
+        n_ok = 0
+        # CopyProcess.run blocks, so batches run on threads, at most
+        # max_inflight of them at once
+        with ThreadPoolExecutor(max_workers=self.max_inflight) as executor:
+            futures = [
+                executor.submit(self._copy_xrootd_batch, src, dst)
+                for src, dst in self._batches(copy_iter)
+            ]
+            for future in as_completed(futures):
+                try:
+                    n_ok += future.result()
+                except Exception as e:
+                    logger.error(f"❌ XRootD batch download failed: {e}")
+
+        logger.info(f"✅ XRootD download finished, {n_ok} files transferred.")
+        return n_ok
+
+    # glob cache
+    def _load_glob_cache(self):
         try:
-            result = alien.DO_XrootdCp(
-                wb=session,
-                xrd_copy_command=self.alien_args,
-                api_src=prefixed_remote,
-                api_dst=prefixed_local,
-            )
+            with open(self.glob_cache_path, "r") as f:
+                cache = json.load(f)
+        except FileNotFoundError:
+            return {}
         except Exception as e:
-            logger.error(f"❌ AliEn download failed: {e}")
-            return 0
+            logger.warning(
+                f"⚠️ Ignoring unreadable glob cache {self.glob_cache_path}: {e}"
+            )
+            return {}
+        if not isinstance(cache, dict):
+            logger.warning(f"⚠️ Ignoring malformed glob cache {self.glob_cache_path}")
+            return {}
+        return cache
+
+    def _fresh_cache_entry(self, entry, now):
+        # malformed entries are treated like missing ones
+        return (
+            isinstance(entry, dict)
+            and isinstance(entry.get("time"), (int, float))
+            and isinstance(entry.get("files"), list)
+            and isinstance(entry.get("sizes", []), list)
+            and now - entry["time"] < self.cache_ttl
+        )
 
-        logger.info("✅ AliEn download finished successfully.")
-        return len(remote_files)
+    def _save_glob_cache(self, cache):
+        # write-then-rename so an interrupted run never leaves a broken cache
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.output_dir, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, self.glob_cache_path)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to write glob cache {self.glob_cache_path}: {e}")
 
     # resolve remote_files_glob (always uses alien)
     def _resolve_remote_globs(self):
-        """Find files using alien.DO_find2 regardless of backend."""
-        found_files = []
+        """Find files using alien.DO_find2 regardless of backend.
+
+        Yields the found paths as each search completes.
+        """
         if not self.remote_files_glob:
-            return found_files
+            return
 
         if not alien:
             logger.error(
                 "❌ alienpy is required for remote_files_glob but not installed."
             )
-            return found_files
+            return
 
-        session = self._ensure_alien_connection()
-        if not session:
-            return found_files
+        cache = self._load_glob_cache()
+        now = time.time()
 
         logger.info(
             f"🔍 Resolving {len(self.remote_files_glob)} glob search entries via AliEn..."
         )
 
+        n_found = 0
+        pending = []
         for base, pattern in self.remote_files_glob:
-            search_args = ["-glob", pattern, base]
-            try:
-                result = alien.DO_find2(session, search_args)
-                if not result or not result.out:
-                    logger.warning(f"⚠️ No results for {base}/{pattern}")
-                    continue
-                files = [f for f in result.out.split("\n") if f.strip()]
-                logger.debug(f"Found {len(files)} files in {base} matching {pattern}")
-                found_files.extend(files)
-            except Exception as e:
-                logger.error(f"❌ Error during alien find in {base}: {e}")
-
-        return found_files
+            entry = cache.get(f"{base}|{pattern}")
+            if self._fresh_cache_entry(entry, now):
+                logger.debug(
+                    f"Using {len(entry['files'])} cached files in {base} matching {pattern}"
+                )
+                # sizes are only needed for largest-first scheduling
+                if not self.stream_downloads:
+                    self.file_sizes.update(zip(entry["files"], entry.get("sizes", [])))
+                n_found += len(entry["files"])
+                yield from entry["files"]
+            else:
+                pending.append((base, pattern))
+
+        if pending and self._ensure_alien_connection():
+
+            def _do_find(base, pattern):
+                # find2 always requests the full LFN metadata (find -f), so
+                # the sizes come with the same listing
+                with self._pooled_alien_connection() as session:
+                    result = alien.DO_find2(session, ["-glob", pattern, base])
+                if not result or not result.ansdict:
+                    return []
+                return result.ansdict.get("results", [])
+
+            # DO_find2 is a network roundtrip, so run the searches concurrently
+            with ThreadPoolExecutor(max_workers=min(16, len(pending))) as executor:
+                futures = {executor.submit(_do_find, b, p): (b, p) for b, p in pending}
+                for future in as_completed(futures):
+                    base, pattern = futures[future]
+                    try:
+                        entries = future.result()
+                    except Exception as e:
+                        logger.error(f"❌ Error during alien find in {base}: {e}")
+                        continue
+                    files, sizes = [], []
+                    for e in entries:
+                        if e.get("lfn"):
+                            files.append(e["lfn"])
+                            sizes.append(int(e.get("size", 0)))
+                    del entries
+                    if not files:
+                        logger.warning(f"⚠️ No results for {base}/{pattern}")
+                        continue
+                    logger.debug(
+                        f"Found {len(files)} files in {base} matching {pattern}"
+                    )
+                    if not self.stream_downloads:
+                        self.file_sizes.update(zip(files, sizes))
+                    cache[f"{base}|{pattern}"] = {
+                        "time": now,
+                        "files": files,
+                        "sizes": sizes,
+                    }
+                    n_found += len(files)
+                    yield from files
+
+            # drop expired entries so the cache does not grow without bound
+            self._save_glob_cache(
+                {k: v for k, v in cache.items() if self._fresh_cache_entry(v, now)}
+            )
+
+        if n_found:
+            logger.info(f"📂 Found {n_found} files via remote_files_glob")
+
+    # copy list
+    def _iter_copy_list(self, remote_files, stats):
+        """Yield (remote, local) pairs for files that still need downloading."""
+        seen = set()
+        local_paths = set()
+        scanned_dirs = set()
+        existing = set()
+        for f in remote_files:
+            # globs can overlap each other and the explicit list
+            if f in seen:
+                continue
+            seen.add(f)
+
+            # different remote files may still map to the same local path,
+            # so keep only the first of those
+            l = self._unique_local_path(f)
+            if l in local_paths:
+                logger.warning(f"⚠️ Skipping {f}, local path {l} is already taken")
+                continue
+            local_paths.add(l)
+            stats["total"] += 1
+
+            # create every target directory once and list it in one call
+            # instead of a makedirs and a stat call per file
+            d = os.path.dirname(l)
+            if d not in scanned_dirs:
+                scanned_dirs.add(d)
+                os.makedirs(d, exist_ok=True)
+                with os.scandir(d) as entries:
+                    existing.update(e.path for e in entries if e.is_file())
+            if l in existing:
+                stats["skipped"] += 1
+                continue
+
+            yield f, l
+
+    def _to_urls(self, copy_iter):
+        # AliEn based backends expect alien:// sources and file: destinations,
+        # with an XCache configured TGrid reads through the local proxy instead
+        if self.backend == "TGrid" and self.xcache_url:
+            xcache_prefix = self.xcache_url.rstrip("/") + "/"
+            return (
+                (xcache_prefix + r.removeprefix("alien://"), "file:" + l)
+                for r, l in copy_iter
+            )
+        elif self.backend in ("TGrid", "alienpy"):
+            return (
+                (r if r.startswith("alien://") else "alien://" + r, "file:" + l)
+                for r, l in copy_iter
+            )
+        return copy_iter
 
     # Main download
     def download(self):
-        # Step 1: expand remote globs
-        found_files = self._resolve_remote_globs()
-        if found_files:
-            logger.info(f"📂 Found {len(found_files)} files via remote_files_glob")
-            if self.remote_files:
-                self.remote_files.extend(found_files)
-            else:
-                self.remote_files = found_files
-
-        if not self.remote_files:
-            logger.warning("⚠️ No remote files specified.")
-            return
+        # CopyProcess only understands URLs, AliEn LFNs need TGrid or alienpy
+        if self.backend == "xrootd":
+            if self.remote_files_glob:
+                logger.error(
+                    "❌ remote_files_glob is not supported by the xrootd backend."
+                )
+                return
+            non_url = [
+                f
+                for f in self.remote_files or []
+                if not f.startswith(("root://", "roots://"))
+            ]
+            if non_url:
+                logger.error(
+                    f"❌ xrootd backend needs root:// sources, got {len(non_url)} others, e.g. {non_url[0]}"
+                )
+                return
 
-        # Step 2: build local paths
-        copy_list = [(f, self._unique_local_path(f)) for f in self.remote_files]
-        logger.info(
-            f"🚀 Starting download using backend: {self.backend} with {len(copy_list)} files"
+        # Step 1: expand remote globs and build local paths, lazily so that
+        # in streaming mode downloads start before all globs are resolved
+        stats = {"total": 0, "skipped": 0}
+        copy_iter = self._iter_copy_list(
+            chain(self.remote_files or [], self._resolve_remote_globs()), stats
         )
 
-        # Step 3: perform download
+        if self.stream_downloads:
+            logger.info(f"🚀 Starting streaming download using backend: {self.backend}")
+        else:
+            copy_iter = list(copy_iter)
+            if stats["skipped"]:
+                logger.info(f"✅ Skipping {stats['skipped']} already existing files")
+            if not stats["total"]:
+                logger.warning("⚠️ No remote files specified.")
+                return
+            if not copy_iter:
+                logger.info(
+                    f"✅ Done. {stats['skipped']}/{stats['total']} files downloaded."
+                )
+                return
+
+            # largest files first, so no worker is left with a big file at the end
+            if self.file_sizes:
+                copy_iter.sort(key=lambda rl: -self.file_sizes.get(rl[0], 0))
+            logger.info(
+                f"🚀 Starting download using backend: {self.backend} with {len(copy_iter)} files"
+            )
+
+        copy_iter = self._to_urls(copy_iter)
+
+        # Step 2: perform download
         if self.backend == "TGrid":
-            # Remove alien object to allow pickling
-            if hasattr(self, "alien_session"):
-                del self.alien_session
-            with Pool(processes=self.num_workers) as pool:
-                results = pool.map(self._download_file, copy_list)
-            n_ok = sum(r is not None for r in results)
+            n_ok = 0
+            # fork lets workers inherit the already imported ROOT instead of
+            # re-importing it in every worker, spawn is the fallback on Windows
+            start_method = (
+                "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+            )
+            ctx = multiprocessing.get_context(start_method)
+            with self._xrootd_env(), ctx.Pool(
+                processes=self.num_workers,
+                initializer=_init_worker,
+                initargs=(self.backend, self.copy_buffer_size, not self.xcache_url),
+            ) as pool:
+                for r in pool.imap_unordered(
+                    _worker_download_file, copy_iter, chunksize=1
+                ):
+                    if r is not None:
+                        n_ok += 1
+                        if n_ok % 100 == 0:
+                            logger.info(f"📦 {n_ok} files downloaded so far")
 
         elif self.backend == "alienpy":
-            remote_files, local_files = zip(*copy_list)
-            n_ok = self._download_alien(remote_files, local_files)
+            n_ok = self._download_alien(copy_iter)
+
+        elif self.backend == "xrootd":
+            n_ok = self._download_xrootd(copy_iter)
 
         else:
             logger.error(f"❌ Unsupported backend: {self.backend}")
             return
 
-        logger.info(f"✅ Done. {n_ok}/{len(copy_list)} files downloaded.")
+        if not stats["total"]:
+            logger.warning("⚠️ No remote files specified.")
+            return
+        logger.info(
+            f"✅ Done. {n_ok + stats['skipped']}/{stats['total']} files downloaded."
+        )
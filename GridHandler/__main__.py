@@ -56,6 +56,8 @@ def main():
     except Exception as e:
         logger.error(f"Download failed:\n{e}")
         sys.exit(1)
+    finally:
+        handler.close()
 
 
 if __name__ == "__main__":